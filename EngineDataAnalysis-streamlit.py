@@ -1,271 +1,301 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
 import plotly.express as px
-import seaborn as sns
+import plotly.graph_objects as go
 import matplotlib.pyplot as plt
+from scipy import stats
 from datetime import datetime, time
 import matplotlib as mpl
 
-st.set_page_config(layout="wide")
-
-@st.cache_data
-def load_data():
-    df = pd.read_csv("df_5min.csv", parse_dates=['Device Date/Time'])
-    df['Device Date/Time'] = df['Device Date/Time'].dt.tz_localize(None)
-    return df
-
-df = load_data()
-
-# Sidebar filters
-st.sidebar.header("Filter by Time Range")
-start_date = st.sidebar.date_input("Start Date", df['Device Date/Time'].min().date())
-start_time_input = st.sidebar.time_input("Start Time", time(0, 0))
-end_date = st.sidebar.date_input("End Date", df['Device Date/Time'].max().date())
-end_time_input = st.sidebar.time_input("End Time", time(23, 59))
-
-start_datetime = datetime.combine(start_date, start_time_input)
-end_datetime = datetime.combine(end_date, end_time_input)
-
-df_filtered = df[(df['Device Date/Time'] >= start_datetime) & (df['Device Date/Time'] <= end_datetime)]
-
-# Load external data
-payload_df = pd.read_csv("payload_df.csv", parse_dates=['cycle_start_time'])
-channel_summary_tab = pd.read_csv("channel_summary_tab.csv", parse_dates=['cycle_start_time'])
-
-channel_summary_tab['cycle_start_time'] = pd.to_datetime(channel_summary_tab['cycle_start_time'])
-
-# Filter based on time
-filtered_sql_df = channel_summary_tab[
-    (channel_summary_tab['cycle_start_time'] >= start_datetime) &
-    (channel_summary_tab['cycle_start_time'] <= end_datetime)
-]
-
-# Channel code selection
-channel_codes = filtered_sql_df['channel_code'].unique()
-selected_channel = st.sidebar.selectbox("Select Channel Code", sorted(channel_codes) if len(channel_codes) > 0 else ["None"])
-
-filtered_channel_df = filtered_sql_df[filtered_sql_df['channel_code'] == selected_channel]
-
-# Round and aggregate payload
-payload_df['cycle_start_time'] = pd.to_datetime(payload_df['cycle_start_time'])
-payload_df['cycle_start_time_5min'] = payload_df['cycle_start_time'].dt.floor('5T')
-
-agg_payload_5min = (
-    payload_df
-    .groupby('cycle_start_time_5min')['avg_payload']
-    .agg(sum_payload='sum', count_payload='count', avg_payload='mean')
-    .reset_index()
-)
-
-filtered_channel_df = pd.merge(
-    filtered_channel_df,
-    agg_payload_5min,
-    left_on='cycle_start_time',
-    right_on='cycle_start_time_5min',
-    how='left'
-)
-
-# Merge for final analysis
-merged_df = pd.merge(
-    df_filtered,
-    filtered_channel_df,
-    how='inner',
-    left_on='Device Date/Time',
-    right_on='cycle_start_time'
-)
-
-# Columns already present in merged_df
-existing_cols = set(merged_df.columns)
-
-# Drop overlapping columns from filtered_channel_df before the second merge
-# (excluding the key used for merge)
-columns_to_drop = [col for col in filtered_channel_df.columns if col in existing_cols and col != 'cycle_start_time_5min']
-filtered_channel_df_cleaned = filtered_channel_df.drop(columns=columns_to_drop)
-
-# Now do the final merge
-final_merged_df = pd.merge(
-    merged_df,
-    filtered_channel_df_cleaned,
-    left_on='Device Date/Time',
-    right_on='cycle_start_time_5min',
-    how='inner'
-)
-
-final_merged_df.to_csv("final_merged_df.csv", index=False)
-
-# Dashboard Title
-st.title("EX3600 Excavator - Fuel Use & Emission Dashboard")
-
-# KPIs
-col1, col2, col3 = st.columns(3)
-col1.metric("Total Fuel Used (L)", f"{df_filtered['FUEL USED DELTA'].sum():.2f}")
-col2.metric("Estimated CO₂ (kg)", f"{df_filtered['Estimated CO2 (kg)'].sum():.2f}")
-col3.metric("Avg Engine Load (%)", f"{df_filtered['ENGINE LOAD'].mean():.1f}")
-
-# Graphs Section
-# --- Row 1 ---
-col1, col2 = st.columns(2)
-
-with col1:
-    st.subheader("Fuel Rate Over Time")
-    fig = px.line(df_filtered, x='Device Date/Time', y='FUEL RATE', title='Fuel Rate (L/hr)')
-    st.plotly_chart(fig, use_container_width=True)
-
-with col2:
-    st.subheader("Engine Load vs Fuel Rate")
-    fig2 = px.scatter(df_filtered, x='ENGINE LOAD', y='FUEL RATE', color='Estimated CO2 (kg)',
-                      title="Engine Load vs Fuel Rate (CO₂ colored)")
-    st.plotly_chart(fig2, use_container_width=True)
-
-# --- Row 2 ---
-col1, col2 = st.columns(2)
-
-with col1:
-    st.subheader("Damage vs Fuel Rate")
-    fig3 = px.scatter(merged_df, x='damage', y='FUEL RATE', color='Estimated CO2 (kg)',
-                      title="Damage vs Fuel Rate (CO₂ colored)")
-    st.plotly_chart(fig3, use_container_width=True)
-
-with col2:
-    st.subheader("Life vs Fuel Rate")
-    fig4 = px.scatter(merged_df, x='life', y='FUEL RATE', color='Estimated CO2 (kg)',
-                      title="Life vs Fuel Rate (CO₂ colored)")
-    st.plotly_chart(fig4, use_container_width=True)
-
-# --- Row 3 ---
-col1, col2 = st.columns(2)
-
-with col1:
-    st.subheader("Normal Distribution of 'Life'")
-    fig6, ax = plt.subplots(figsize=(6, 4))
-    sns.histplot(filtered_channel_df['life'].dropna(), kde=True, stat="density", bins=30, ax=ax, color='skyblue')
-    ax.set_title("Distribution of Life with Bell Curve")
-    ax.set_xlabel("Life")
-    ax.set_ylabel("Density")
-    fig6.tight_layout()
-    st.pyplot(fig6)
-
-with col2:
-    st.subheader("Heatmap: Intake Temp vs Fuel Rate")
-    heatmap_df = df_filtered[['INTAKE TEMP', 'FUEL RATE']].dropna()
-    fig5, ax = plt.subplots(figsize=(6, 4))
-    sns.histplot(data=heatmap_df, x='INTAKE TEMP', y='FUEL RATE', bins=30, ax=ax, cmap='YlOrRd')
-    ax.set_title("Heatmap: Intake Temp vs Fuel Rate")
-    fig5.tight_layout()
-    st.pyplot(fig5)
-
-# --- Row 4 ---
-col1, col2 = st.columns(2)
-
-with col1:
-    st.subheader("Throttle vs Fuel Rate")
-    if 'THROTTLE' in df_filtered.columns:
-        fig_throttle = px.scatter(df_filtered, x='THROTTLE', y='FUEL RATE',
-                                  title="Throttle vs Fuel Rate")
-        st.plotly_chart(fig_throttle, use_container_width=True)
-    else:
-        st.write("Throttle data is not available.")
-
-with col2:
-    st.subheader("Engine Speed vs Fuel Rate")
-    if 'ENGINE SPEED' in df_filtered.columns:
-        fig_speed = px.scatter(df_filtered, x='ENGINE SPEED', y='FUEL RATE',
-                               title="Engine Speed vs Fuel Rate")
-        st.plotly_chart(fig_speed, use_container_width=True)
-    else:
-        st.write("Engine speed data is not available.")
+from pipeline import load_data, load_channel_index, build_final, channels_in_range
+
+# Upper bound on points sent to the browser per Plotly chart
+MAX_PLOT_POINTS = 5000
+
+def scatter_sample(frame):
+    # A fixed random sample keeps the shape of a scatter while capping the JSON payload
+    if len(frame) > MAX_PLOT_POINTS:
+        return frame.sample(MAX_PLOT_POINTS, random_state=0)
+    return frame
+
+def line_sample(frame):
+    # Time series are averaged into equal bins (a multiple of the 5-min sampling interval) instead
+    if len(frame) > MAX_PLOT_POINTS:
+        rule = ((frame.index[-1] - frame.index[0]) / MAX_PLOT_POINTS).ceil('5min')
+        return frame.resample(rule).mean()
+    return frame
+
+# The KDE curve is fitted on at most this many points; it is O(N^2) to evaluate otherwise
+KDE_SAMPLE = 2000
+
+def hist_with_kde(ax, values, bins, color, edgecolor=None):
+    # Density histogram from np.histogram plus a KDE curve, drawn straight onto the matplotlib axes
+    values = values[~np.isnan(values)]
+    if values.size == 0:
+        return
+    counts, edges = np.histogram(values, bins=bins, density=True)
+    ax.bar(edges[:-1], counts, width=np.diff(edges), align='edge', color=color, edgecolor=edgecolor, alpha=0.75)
+    sample = np.random.default_rng(0).choice(values, min(values.size, KDE_SAMPLE), replace=False)
+    # gaussian_kde needs some spread in the data
+    if np.ptp(sample) > 0:
+        xs = np.linspace(edges[0], edges[-1], 200)
+        ax.plot(xs, stats.gaussian_kde(sample)(xs), color=color)
+
+def heatmap_2d(ax, x, y, bins, cmap):
+    # Counts from np.histogram2d drawn as a single image; empty cells are left transparent
+    if x.size == 0:
+        return
+    counts, xedges, yedges = np.histogram2d(x, y, bins=bins)
+    ax.imshow(np.ma.masked_equal(counts.T, 0), origin='lower', aspect='auto', cmap=cmap,
+              extent=[xedges[0], xedges[-1], yedges[0], yedges[-1]])
+
+def session_axes(key, figsize):
+    # Each matplotlib chart keeps one Figure per session and just clears its axes on rerun
+    if key not in st.session_state:
+        st.session_state[key] = plt.subplots(figsize=figsize)
+    fig, ax = st.session_state[key]
+    ax.clear()
+    return fig, ax
+
+# Shared layout for every scatter, built once instead of per Plotly Express call
+SCATTER_LAYOUT = go.Layout(margin=dict(l=40, r=10, t=40, b=30))
+
+def scatter(frame, x, y, color=None, title=None):
+    # WebGL markers fed straight from numpy arrays, skipping the px DataFrame-to-trace pipeline
+    marker = {}
+    if color is not None:
+        marker = dict(color=frame[color].to_numpy(), colorscale='Plasma', showscale=True,
+                      colorbar=dict(title=color))
+    fig = go.Figure(
+        go.Scattergl(x=frame[x].to_numpy(), y=frame[y].to_numpy(), mode='markers', marker=marker),
+        layout=SCATTER_LAYOUT,
+    )
+    fig.update_layout(title=title, xaxis_title=x, yaxis_title=y)
+    return fig
+
+def render_sidebar(df, channel_index):
+    # Sidebar filters
+    st.sidebar.header("Filter by Time Range")
+    start_date = st.sidebar.date_input("Start Date", df.index.min().date())
+    start_time_input = st.sidebar.time_input("Start Time", time(0, 0))
+    end_date = st.sidebar.date_input("End Date", df.index.max().date())
+    end_time_input = st.sidebar.time_input("End Time", time(23, 59))
+
+    start_datetime = datetime.combine(start_date, start_time_input)
+    end_datetime = datetime.combine(end_date, end_time_input)
+
+    # Channel code selection
+    channel_codes = channels_in_range(channel_index, start_datetime, end_datetime)
+    selected_channel = st.sidebar.selectbox("Select Channel Code", sorted(channel_codes) if len(channel_codes) > 0 else ["None"])
+    return start_datetime, end_datetime, selected_channel
+
+def render_kpis(df_filtered):
+    col1, col2, col3 = st.columns(3)
+    # NaN-skipping numpy reductions on the raw arrays match pandas' sum/mean without the Series overhead
+    col1.metric("Total Fuel Used (L)", f"{np.nansum(df_filtered['FUEL USED DELTA'].to_numpy()):.2f}")
+    col2.metric("Estimated CO₂ (kg)", f"{np.nansum(df_filtered['Estimated CO2 (kg)'].to_numpy()):.2f}")
+    col3.metric("Avg Engine Load (%)", f"{np.nanmean(df_filtered['ENGINE LOAD'].to_numpy()):.1f}")
 
-# --- Row 5 ---
-col1, col2 = st.columns(2)
+def render_plots(df_filtered, filtered_channel_df, merged_df):
+    # The KPIs use every row; the charts only need enough points to show the shape
+    df_plot = scatter_sample(df_filtered)
+    merged_plot = scatter_sample(merged_df)
 
-with col1:
-    st.subheader("Speed vs Fuel Rate")
-    if 'Speed' in df_filtered.columns:
-        fig_speed_fuel = px.scatter(df_filtered, x='Speed', y='FUEL RATE',
-                                    title="Speed vs Fuel Rate")
-        st.plotly_chart(fig_speed_fuel, use_container_width=True)
-    else:
-        st.write("Speed data is not available.")
-
-with col2:
-    st.subheader("Cumulative Fuel Used Over Time")
-    if not df_filtered.empty:
-        df_filtered['Cumulative Fuel'] = df_filtered['FUEL USED DELTA'].cumsum()
-        fig_cumulative = px.line(df_filtered, x='Device Date/Time', y='Cumulative Fuel',
-                                  title="Cumulative Fuel Used Over Time")
-        st.plotly_chart(fig_cumulative, use_container_width=True)
-    else:
-        st.write("No data available for the selected time range.")
+    # Graphs Section
+    # --- Row 1 ---
+    col1, col2 = st.columns(2)
 
-# --- Payload section ---
-st.markdown("## Payload vs Fuel Metrics")
+    with col1:
+        st.subheader("Fuel Rate Over Time")
+        line_df = line_sample(df_filtered)
+        fig = px.line(line_df, x=line_df.index, y='FUEL RATE', title='Fuel Rate (L/hr)')
+        st.plotly_chart(fig, use_container_width=True)
 
-if not filtered_channel_df.empty and 'FUEL RATE' in final_merged_df.columns and 'FUEL USED DELTA' in final_merged_df.columns:
+    with col2:
+        st.subheader("Engine Load vs Fuel Rate")
+        fig2 = scatter(df_plot, 'ENGINE LOAD', 'FUEL RATE', color='Estimated CO2 (kg)',
+                       title="Engine Load vs Fuel Rate (CO₂ colored)")
+        st.plotly_chart(fig2, use_container_width=True)
 
-    col1, col2, col3 = st.columns(3)
+    # --- Row 2 ---
+    col1, col2 = st.columns(2)
 
     with col1:
-        st.subheader("Sum Payload vs Fuel Rate")
-        fig_payload1 = px.scatter(final_merged_df, x='sum_payload', y='FUEL RATE')
-        st.plotly_chart(fig_payload1, use_container_width=True)
+        st.subheader("Damage vs Fuel Rate")
+        fig3 = scatter(merged_plot, 'damage', 'FUEL RATE', color='Estimated CO2 (kg)',
+                       title="Damage vs Fuel Rate (CO₂ colored)")
+        st.plotly_chart(fig3, use_container_width=True)
 
     with col2:
-        st.subheader("Count Payload vs Fuel Rate")
-        fig_payload2 = px.scatter(final_merged_df, x='count_payload', y='FUEL RATE')
-        st.plotly_chart(fig_payload2, use_container_width=True)
-
-    with col3:
-        st.subheader("Avg Payload vs Fuel Rate")
-        fig_payload3 = px.scatter(final_merged_df, x='avg_payload', y='FUEL RATE')
-        st.plotly_chart(fig_payload3, use_container_width=True)
-
-    col4, col5, col6 = st.columns(3)
-
-    with col4:
-        st.subheader("Sum Payload vs Fuel Used")
-        fig_payload4 = px.scatter(final_merged_df, x='sum_payload', y='FUEL USED DELTA')
-        st.plotly_chart(fig_payload4, use_container_width=True)
-
-    with col5:
-        st.subheader("Count Payload vs Fuel Used")
-        fig_payload5 = px.scatter(final_merged_df, x='count_payload', y='FUEL USED DELTA')
-        st.plotly_chart(fig_payload5, use_container_width=True)
-
-    with col6:
-        st.subheader("Avg Payload vs Fuel Used")
-        fig_payload6 = px.scatter(final_merged_df, x='avg_payload', y='FUEL USED DELTA')
-        st.plotly_chart(fig_payload6, use_container_width=True)
-
-    # Apply a clean and professional style
-    mpl.rcParams.update({
-        'axes.titlesize': 12,
-        'axes.labelsize': 10,
-        'xtick.labelsize': 9,
-        'ytick.labelsize': 9,
-        'axes.grid': True,
-        'grid.alpha': 0.3,
-        'grid.color': '#cccccc',
-        'axes.facecolor': 'white',
-        'axes.edgecolor': '#dddddd',
-        'figure.facecolor': 'white'
-    })
-
-    st.subheader("Normal Distribution of 'No. of Passes'")
-    fig_payload7, ax = plt.subplots(figsize=(5, 3))  # Smaller figure
-    sns.histplot(
-        final_merged_df['count_payload'].dropna(),
-        kde=True,
-        stat="density",
-        bins=25,
-        ax=ax,
-        color='#4a90e2',  # Softer blue
-        edgecolor='white'
-    )
-    ax.set_title("Distribution of No. of Passes", fontsize=11)
-    ax.set_xlabel("No. of Passes", fontsize=10)
-    ax.set_ylabel("Density", fontsize=10)
-    fig_payload7.tight_layout()
-    st.pyplot(fig_payload7)
-
-else:
-    st.warning("Payload or fuel data is missing or could not be merged correctly.")
+        st.subheader("Life vs Fuel Rate")
+        fig4 = scatter(merged_plot, 'life', 'FUEL RATE', color='Estimated CO2 (kg)',
+                       title="Life vs Fuel Rate (CO₂ colored)")
+        st.plotly_chart(fig4, use_container_width=True)
+
+    # --- Row 3 ---
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.subheader("Normal Distribution of 'Life'")
+        fig6, ax = session_axes('life_fig', figsize=(6, 4))
+        hist_with_kde(ax, filtered_channel_df['life'].to_numpy(), bins=30, color='skyblue')
+        ax.set_title("Distribution of Life with Bell Curve")
+        ax.set_xlabel("Life")
+        ax.set_ylabel("Density")
+        fig6.tight_layout()
+        st.pyplot(fig6)
+
+    with col2:
+        st.subheader("Heatmap: Intake Temp vs Fuel Rate")
+        heatmap_df = df_filtered[['INTAKE TEMP', 'FUEL RATE']].dropna()
+        fig5, ax = session_axes('heatmap_fig', figsize=(6, 4))
+        heatmap_2d(ax, heatmap_df['INTAKE TEMP'].to_numpy(), heatmap_df['FUEL RATE'].to_numpy(), bins=30, cmap='YlOrRd')
+        ax.set_xlabel('INTAKE TEMP')
+        ax.set_ylabel('FUEL RATE')
+        ax.set_title("Heatmap: Intake Temp vs Fuel Rate")
+        fig5.tight_layout()
+        st.pyplot(fig5)
+
+    # --- Row 4 ---
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.subheader("Throttle vs Fuel Rate")
+        if 'THROTTLE' in df_filtered.columns:
+            fig_throttle = scatter(df_plot, 'THROTTLE', 'FUEL RATE',
+                                   title="Throttle vs Fuel Rate")
+            st.plotly_chart(fig_throttle, use_container_width=True)
+        else:
+            st.write("Throttle data is not available.")
+
+    with col2:
+        st.subheader("Engine Speed vs Fuel Rate")
+        if 'ENGINE SPEED' in df_filtered.columns:
+            fig_speed = scatter(df_plot, 'ENGINE SPEED', 'FUEL RATE',
+                                title="Engine Speed vs Fuel Rate")
+            st.plotly_chart(fig_speed, use_container_width=True)
+        else:
+            st.write("Engine speed data is not available.")
+
+    # --- Row 5 ---
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.subheader("Speed vs Fuel Rate")
+        if 'Speed' in df_filtered.columns:
+            fig_speed_fuel = scatter(df_plot, 'Speed', 'FUEL RATE',
+                                     title="Speed vs Fuel Rate")
+            st.plotly_chart(fig_speed_fuel, use_container_width=True)
+        else:
+            st.write("Speed data is not available.")
+
+    with col2:
+        st.subheader("Cumulative Fuel Used Over Time")
+        if df_filtered.empty:
+            st.write("No data available for the selected time range.")
+        # Streamlit runs collapsed sections too, so the cumulative sum is only computed once asked for
+        elif st.checkbox("Show cumulative fuel used", value=False):
+            cumulative = pd.DataFrame(
+                {'Cumulative Fuel': np.nancumsum(df_filtered['FUEL USED DELTA'].to_numpy())},
+                index=df_filtered.index,
+            )
+            line_df = line_sample(cumulative)
+            fig_cumulative = px.line(line_df, x=line_df.index, y='Cumulative Fuel',
+                                     title="Cumulative Fuel Used Over Time")
+            st.plotly_chart(fig_cumulative, use_container_width=True)
+
+def render_payload(filtered_channel_df, final_merged_df):
+    final_merged_plot = scatter_sample(final_merged_df)
+
+    # --- Payload section ---
+    st.markdown("## Payload vs Fuel Metrics")
+
+    if not filtered_channel_df.empty and 'FUEL RATE' in final_merged_df.columns and 'FUEL USED DELTA' in final_merged_df.columns:
+
+        col1, col2, col3 = st.columns(3)
+
+        with col1:
+            st.subheader("Sum Payload vs Fuel Rate")
+            fig_payload1 = scatter(final_merged_plot, 'sum_payload', 'FUEL RATE')
+            st.plotly_chart(fig_payload1, use_container_width=True)
+
+        with col2:
+            st.subheader("Count Payload vs Fuel Rate")
+            fig_payload2 = scatter(final_merged_plot, 'count_payload', 'FUEL RATE')
+            st.plotly_chart(fig_payload2, use_container_width=True)
+
+        with col3:
+            st.subheader("Avg Payload vs Fuel Rate")
+            fig_payload3 = scatter(final_merged_plot, 'avg_payload', 'FUEL RATE')
+            st.plotly_chart(fig_payload3, use_container_width=True)
+
+        col4, col5, col6 = st.columns(3)
+
+        with col4:
+            st.subheader("Sum Payload vs Fuel Used")
+            fig_payload4 = scatter(final_merged_plot, 'sum_payload', 'FUEL USED DELTA')
+            st.plotly_chart(fig_payload4, use_container_width=True)
+
+        with col5:
+            st.subheader("Count Payload vs Fuel Used")
+            fig_payload5 = scatter(final_merged_plot, 'count_payload', 'FUEL USED DELTA')
+            st.plotly_chart(fig_payload5, use_container_width=True)
+
+        with col6:
+            st.subheader("Avg Payload vs Fuel Used")
+            fig_payload6 = scatter(final_merged_plot, 'avg_payload', 'FUEL USED DELTA')
+            st.plotly_chart(fig_payload6, use_container_width=True)
+
+        # Apply a clean and professional style
+        mpl.rcParams.update({
+            'axes.titlesize': 12,
+            'axes.labelsize': 10,
+            'xtick.labelsize': 9,
+            'ytick.labelsize': 9,
+            'axes.grid': True,
+            'grid.alpha': 0.3,
+            'grid.color': '#cccccc',
+            'axes.facecolor': 'white',
+            'axes.edgecolor': '#dddddd',
+            'figure.facecolor': 'white'
+        })
+
+        st.subheader("Normal Distribution of 'No. of Passes'")
+        fig_payload7, ax = session_axes('passes_fig', figsize=(5, 3))  # Smaller figure
+        hist_with_kde(
+            ax,
+            final_merged_df['count_payload'].to_numpy(),
+            bins=25,
+            color='#4a90e2',  # Softer blue
+            edgecolor='white'
+        )
+        ax.set_title("Distribution of No. of Passes", fontsize=11)
+        ax.set_xlabel("No. of Passes", fontsize=10)
+        ax.set_ylabel("Density", fontsize=10)
+        fig_payload7.tight_layout()
+        st.pyplot(fig_payload7)
+
+    else:
+        st.warning("Payload or fuel data is missing or could not be merged correctly.")
+
+def main():
+    st.set_page_config(layout="wide")
+
+    df = load_data()
+    channel_index = load_channel_index()
+
+    start_datetime, end_datetime, selected_channel = render_sidebar(df, channel_index)
+    df_filtered, filtered_channel_df, merged_df, final_merged_df = build_final(start_datetime, end_datetime, selected_channel)
+
+    final_merged_df.to_csv("final_merged_df.csv", index_label='Device Date/Time')
+
+    # Dashboard Title
+    st.title("EX3600 Excavator - Fuel Use & Emission Dashboard")
+
+    render_kpis(df_filtered)
+    render_plots(df_filtered, filtered_channel_df, merged_df)
+    render_payload(filtered_channel_df, final_merged_df)
+
+if __name__ == "__main__":
+    main()
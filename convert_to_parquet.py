@@ -0,0 +1,24 @@
+import pandas as pd
+
+from pipeline import downcast_numeric
+
+# One-off conversion of the dashboard inputs from CSV to Parquet.
+# Timestamps are written tz-naive datetime64[ns] and each table is sorted by time so the
+# dashboard can read them back without any re-parsing or normalisation.
+# Numeric columns are downcast before writing so the smaller dtypes survive a reload.
+
+df = pd.read_csv("df_5min.csv", parse_dates=['Device Date/Time'])
+df['Device Date/Time'] = df['Device Date/Time'].dt.tz_localize(None).astype('datetime64[ns]')
+df = df.sort_values('Device Date/Time', kind='stable', ignore_index=True)
+downcast_numeric(df).to_parquet("df_5min.parquet", engine="pyarrow", index=False)
+
+# The payload and channel exports use Australian day-first dates (1/05/2025 = 1 May)
+payload_df = pd.read_csv("payload_df.csv")
+payload_df['cycle_start_time'] = pd.to_datetime(payload_df['cycle_start_time'], dayfirst=True).astype('datetime64[ns]')
+payload_df = payload_df.sort_values('cycle_start_time', kind='stable', ignore_index=True)
+downcast_numeric(payload_df).to_parquet("payload_df.parquet", engine="pyarrow", index=False)
+
+channel_summary_tab = pd.read_csv("channel_summary_tab.csv")
+channel_summary_tab['cycle_start_time'] = pd.to_datetime(channel_summary_tab['cycle_start_time'], dayfirst=True).astype('datetime64[ns]')
+channel_summary_tab = channel_summary_tab.sort_values('cycle_start_time', kind='stable', ignore_index=True)
+downcast_numeric(channel_summary_tab).to_parquet("channel_summary_tab.parquet", engine="pyarrow", index=False)
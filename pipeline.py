@@ -0,0 +1,102 @@
+import streamlit as st
+import pandas as pd
+import numpy as np
+
+# Only the columns the dashboard actually reads; Parquet skips the rest on disk
+DF_COLS = ['Device Date/Time', 'FUEL RATE', 'FUEL USED DELTA', 'Estimated CO2 (kg)', 'ENGINE LOAD',
+           'INTAKE TEMP', 'THROTTLE', 'ENGINE SPEED', 'Speed']
+PAYLOAD_COLS = ['cycle_start_time', 'avg_payload']
+CHANNEL_COLS = ['cycle_start_time', 'channel_code', 'life', 'damage']
+
+def downcast_numeric(frame):
+    # float32 / smallest int is plenty for the dashboard and halves the bytes moved per rerun
+    for c in frame.select_dtypes('float64').columns:
+        frame[c] = pd.to_numeric(frame[c], downcast='float')
+    for c in frame.select_dtypes('integer').columns:
+        frame[c] = pd.to_numeric(frame[c], downcast='integer')
+    return frame
+
+FIVE_MIN_NS = 300_000_000_000
+
+def sorted_by_time(frame):
+    # convert_to_parquet.py already writes typed, time-sorted tables, so this is normally just the check
+    if frame.index.is_monotonic_increasing:
+        return frame
+    return frame.sort_index(kind='stable')
+
+def time_bounds(frame, start_datetime, end_datetime):
+    # Positions of [start, end] found by binary search on the index's int64 ns view (zero-copy)
+    ts = frame.index.to_numpy('datetime64[ns]').view('i8')
+    lo = ts.searchsorted(np.int64(pd.Timestamp(start_datetime).value))
+    hi = ts.searchsorted(np.int64(pd.Timestamp(end_datetime).value), side='right')
+    return lo, hi
+
+def time_slice(frame, start_datetime, end_datetime):
+    lo, hi = time_bounds(frame, start_datetime, end_datetime)
+    return frame.iloc[lo:hi]
+
+# The .parquet files are produced from the CSV exports by convert_to_parquet.py
+@st.cache_data
+def load_data():
+    df = downcast_numeric(pd.read_parquet("df_5min.parquet", columns=DF_COLS, engine="pyarrow"))
+    # A sorted DatetimeIndex turns time-range filters into a binary search
+    return sorted_by_time(df.set_index('Device Date/Time'))
+
+@st.cache_data
+def load_payload_agg():
+    # The 5-min payload aggregate depends only on the input file, so it is built once, not per rerun
+    payload_df = downcast_numeric(pd.read_parquet("payload_df.parquet", columns=PAYLOAD_COLS, engine="pyarrow"))
+    # Group on the integer 5-min bucket number rather than hashing datetimes. The file is sorted by
+    # time, so buckets already come out in order and the groupby sort can be skipped.
+    payload_df['bucket'] = payload_df['cycle_start_time'].to_numpy('datetime64[ns]').view('i8') // FIVE_MIN_NS
+    agg_payload_5min = (
+        payload_df
+        .groupby('bucket', sort=False)['avg_payload']
+        .agg(sum_payload='sum', count_payload='count', avg_payload='mean')
+    )
+    agg_payload_5min.index = pd.DatetimeIndex(
+        (agg_payload_5min.index.to_numpy() * FIVE_MIN_NS).view('datetime64[ns]'), name='cycle_start_time_5min')
+    return agg_payload_5min
+
+@st.cache_data
+def load_channel_index():
+    # One time-indexed sub-frame per channel: selecting a channel is a dict lookup, not a column scan
+    channel_summary_tab = downcast_numeric(
+        pd.read_parquet("channel_summary_tab.parquet", columns=CHANNEL_COLS, engine="pyarrow"))
+    # A dozen codes repeated over every row: as a category the groupby hashes small integer codes
+    # and each cached sub-frame carries codes instead of Python strings
+    channel_summary_tab['channel_code'] = channel_summary_tab['channel_code'].astype('category')
+    return {
+        code: sorted_by_time(sub.set_index('cycle_start_time'))
+        for code, sub in channel_summary_tab.groupby('channel_code', sort=False, observed=True)
+    }
+
+# Keyed on the three sidebar inputs, so reruns that don't change them skip the slicing and joins
+@st.cache_data(show_spinner=False, max_entries=32)
+def build_final(start_datetime, end_datetime, selected_channel):
+    df_filtered = time_slice(load_data(), start_datetime, end_datetime)
+
+    channel_index = load_channel_index()
+    # With no channel in range every slice is empty, so any of them stands in for "None"
+    channel_df = channel_index.get(selected_channel, next(iter(channel_index.values())))
+    filtered_channel_df = time_slice(channel_df, start_datetime, end_datetime)
+
+    # Both sides are keyed on a sorted DatetimeIndex, so these are index joins rather than column hash merges
+    filtered_channel_df = filtered_channel_df.join(load_payload_agg(), how='left')
+
+    # Merge for final analysis
+    merged_df = df_filtered.join(filtered_channel_df, how='inner')
+
+    # filtered_channel_df already carries the payload aggregates, so merged_df is the final frame
+    final_merged_df = merged_df
+
+    return df_filtered, filtered_channel_df, merged_df, final_merged_df
+
+# Channels with at least one row inside the selected range, for the sidebar selectbox
+def channels_in_range(channel_index, start_datetime, end_datetime):
+    channel_codes = []
+    for code, sub in channel_index.items():
+        lo, hi = time_bounds(sub, start_datetime, end_datetime)
+        if hi > lo:
+            channel_codes.append(code)
+    return channel_codes